@@ -0,0 +1,12 @@
+# Builds the optional Cython cipher kernel. Metadata lives in pyproject.toml;
+# when Cython is not installed the package builds as pure Python and
+# caesar_shift.py falls back to its NumPy/Numba paths.
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["src/sk_cryptography/caesar_shift_c.pyx"])
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
@@ -8,13 +8,52 @@
 # Must be using a SageMath Python Interpreter
 from sage.all import *
 
+import numpy as np
+
+# Numba is optional: when it is available, large Vigenere inputs run
+# through a compiled parallel kernel instead of the NumPy expression
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# The compiled Cython kernel is also optional: it only exists when the
+# extension was built with Cython installed (see setup.py)
+try:
+    from caesar_shift_c import vigenere_c
+except ImportError:
+    vigenere_c = None
+
 # Functions from helper_functions will be needed
 from helper_functions import *
 
+# below this many characters the NumPy path wins; above it the compiled
+# kernel splits the work across cores
+_NUMBA_THRESHOLD = 1 << 16
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _vigenere_kernel(s, k, out, n, m):
+        for i in prange(n):
+            out[i] = ((s[i] - 65 + (k[i % m] - 65)) % 26) + 65
+
 # =========================================================================================
 # Caesar Shift
 # =========================================================================================
 
+# Fast-path kernel: assumes s is already cleaned A-Z text, k a letter and N > 0
+def _encrypt_caesar_gram_fast(s, k, N):
+    # find the ASCII number of the key in modulo 26
+    k = (ord(k) - 65) % 26
+    # the cipher is a fixed permutation of A-Z, so build a 256-entry
+    # translation table once and remap the whole string with a single
+    # C-level translate pass
+    table = bytes((((i - 65 + k) % 26) + 65) if 65 <= i <= 90 else i for i in range(256))
+    ciphertext = s.encode('ascii').translate(table)
+    # the ciphertext is already clean, so emit the N-grams directly
+    # rather than re-scanning it through ngram
+    return ' '.join(ciphertext[i:i+N].decode('ascii') for i in range(0, len(ciphertext), N))
+
 # Function to encrypt Caesar shift
 def encrypt_caesar_gram(s,k,N):
     """
@@ -23,39 +62,29 @@ def encrypt_caesar_gram(s,k,N):
     Args:
     s (str): string to be encrypted
     k (str): the key, should be a single letter
-    N (Integer): output will be N-grams
+    N (Integer) or (int): output will be N-grams
 
     Output:
     output (str): an N-gram containing the encrypted s
     """
     # ensure there are no type errors
-    if (type(s) == str) & (type(k) == str) & (type(N) == Integer):
+    if (type(s) == str) and (type(k) == str) and isinstance(N, (int, Integer)):
         # N must be >0 for ngram to work
         if N > 0:
             s = remove_punctuation(s)
             if s != 'Invalid input':
-                # find the ASCII number of the key in modulo 26
-                k = ord(k) - 65
-                shift = []
-                # perform the Caesar shift numerically
-                for i in range(len(s)):
-                    x = (ord(s[i])-65) + k
-                    shift.append(x%26)
-                # convert the numbers back to letters
-                for j in range(len(shift)):
-                    shift[j] = chr(shift[j]+65)
-                output = ""
-                for k in shift:
-                    output += k
-            else:
-                return('Invalid input')
-        else:
-            return('Invalid input')
-    else:
-        return('Invalid input')
-    return ngram(output, N)
+                return _encrypt_caesar_gram_fast(s, k, N)
+    return 'Invalid input'
 
 
+# Fast-path kernel: assumes s is already cleaned A-Z text and k a single letter
+def _decrypt_caesar_fast(s, k):
+    k = (ord(k) - 65) % 26
+    # decryption is just the inverse permutation of A-Z, so a 256-entry
+    # translation table covers it in one C-level pass
+    table = bytes((((i - 65 - k) % 26) + 65) if 65 <= i <= 90 else i for i in range(256))
+    return s.encode('ascii').translate(table).decode('ascii')
+
 # Function to decrypt a Caesar shift
 def decrypt_caesar(s,k):
     """
@@ -69,34 +98,46 @@ def decrypt_caesar(s,k):
     output(str): the decrypted message
     """
     # check user input correct types
-    if (type(s) == str) & (type(k) == str):
+    if (type(s) == str) and (type(k) == str):
         if (len(k) == 1):
             s = remove_punctuation(s)
             if s != 'Invalid input':
-                k = ord(k)-65
-                k = k % 26
-                decrypt = []
-                for i in s:
-                    x = (ord(i) - 65) - k
-                    decrypt.append(x % 26)
-                for j in range(len(decrypt)):
-                    decrypt[j] = chr(decrypt[j]+65)
-                output = ""
-                for k in decrypt:
-                    output += k
-            else:
-                return('Invalid input')
-        else:
-            return('Invalid input')
-    else:
-        return('Invalid input')
-    return output
+                return _decrypt_caesar_fast(s, k)
+    return 'Invalid input'
 
 
 # =========================================================================================
 # Vigenere
 # =========================================================================================
 
+# Fast-path kernel: assumes s and k are already cleaned A-Z text and N > 0
+def _encrypt_vigenere_fast(s, k, N):
+    x = len(k)
+    arr = np.frombuffer(s.encode('ascii'), dtype=np.uint8)
+    karr = np.frombuffer(k.encode('ascii'), dtype=np.uint8)
+    if vigenere_c is not None:
+        # C-level loop over the raw buffers, autovectorized by the compiler
+        out = np.empty_like(arr)
+        vigenere_c(arr, karr, out)
+        ciphertext = out.tobytes()
+    elif njit is not None and len(arr) >= _NUMBA_THRESHOLD:
+        out = np.empty_like(arr)
+        _vigenere_kernel(arr, karr, out, len(arr), x)
+        ciphertext = out.tobytes()
+    else:
+        # repeat the key across the message and shift everything in
+        # one pass; resize allocates exactly len(s) bytes
+        key = np.resize(karr, len(s))
+        shifted = (arr - np.uint8(65)) + (key - np.uint8(65))
+        # shifted is in [0, 50], so a branchless subtract-if-ge
+        # replaces the general integer modulo
+        np.subtract(shifted, 26, where=shifted >= 26, out=shifted)
+        shifted += 65
+        ciphertext = shifted.tobytes()
+    # the ciphertext is already clean, so emit the N-grams directly
+    # rather than re-scanning it through ngram
+    return ' '.join(ciphertext[i:i+N].decode('ascii') for i in range(0, len(ciphertext), N))
+
 # Function to encrypt using Vigenere
 def encrypt_vigenere(s,k,N):
     """
@@ -104,32 +145,18 @@ def encrypt_vigenere(s,k,N):
 
     Args:
     s (str): message to be encrypted
-    k (str): key 
-    N (Integer): the encrypted message will be broken into N-grams
+    k (str): key
+    N (Integer) or (int): the encrypted message will be broken into N-grams
 
     Output:
     output(str): encrypted message
     """
-    if (type(s) == str) & (type(k) == str) & (type(N) == Integer):
+    if (type(s) == str) and (type(k) == str) and isinstance(N, (int, Integer)):
         s = remove_punctuation(s)
         k = remove_punctuation(k)
         if (N > 0) and (s != 'Invalid input') and (k != 'Invalid input'):
-            x = len(k)
-            numbers = []
-            for i in range(len(s)):
-                y = (ord(s[i])-65) + (ord(k[i%x])-65)
-                numbers.append(y%26)
-            output = ""
-            for k in range(len(numbers)):
-                numbers[k] = chr(numbers[k]+65)
-            for j in numbers:
-                output += j
-            output = ngram(output, N)
-        else:
-            output = 'Invalid input'
-    else:
-        output = 'Invalid input'
-    return output
+            return _encrypt_vigenere_fast(s, k, N)
+    return 'Invalid input'
 
 # Function to decrypt Vigenere
 def decrypt_vigenere(s,k):
@@ -141,14 +168,30 @@ def decrypt_vigenere(s,k):
     k (str): key to the Vigenere cipher
 
     Output:
-    output (str): decrypted message 
+    output (str): decrypted message
     """
-    t = str26(s)
-    if t == 'Invalid input': return t
-    if len(k) == 0: return 'Invalid input'
-    if str26(k) == 'Invalid input': return 'Invalid input'
-    key = (str26(k)*len(s))[:len(s)]
-    output = ''
-    for i in range(len(t)):
-        output += chr(((t[i]-key[i])%26)+65)
-    return output
\ No newline at end of file
+    if not isinstance(s, str) or not isinstance(k, str): return 'Invalid input'
+    # clean each input once and reuse the result instead of re-scanning
+    # through str26/remove_punctuation for every check
+    s = remove_punctuation(s)
+    k = remove_punctuation(k)
+    if s == 'Invalid input' or k == 'Invalid input': return 'Invalid input'
+    # subtract the tiled key from the message in one vectorized pass;
+    # int16 keeps the differences signed before the modulo
+    t = np.frombuffer(s.encode('ascii'), dtype=np.uint8).astype(np.int16) - 65
+    kb = np.frombuffer(k.encode('ascii'), dtype=np.uint8).astype(np.int16) - 65
+    key = np.resize(kb, len(t))
+    return (((t - key) % 26) + 65).astype(np.uint8).tobytes().decode('ascii')
+
+if __name__ == "__main__":
+    # round-trip check: whichever kernel _encrypt_vigenere_fast picks
+    # (Cython, Numba or NumPy) must agree with a plain NumPy reference
+    # and decrypt back to the original message
+    msg = "THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG" * 2000
+    key = "LEMON"
+    t = np.frombuffer(msg.encode('ascii'), dtype=np.uint8).astype(np.int16) - 65
+    kb = np.resize(np.frombuffer(key.encode('ascii'), dtype=np.uint8).astype(np.int16) - 65, len(t))
+    reference = (((t + kb) % 26) + 65).astype(np.uint8).tobytes().decode('ascii')
+    encrypted = encrypt_vigenere(msg, key, len(msg))
+    print(encrypted == reference)
+    print(decrypt_vigenere(encrypted, key) == msg)
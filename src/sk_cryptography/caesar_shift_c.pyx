@@ -0,0 +1,18 @@
+# =========================================================================================
+# Cython kernel for the Vigenere cipher
+# =========================================================================================
+# Built by setup.py when Cython is available; caesar_shift.py falls back to
+# its NumPy/Numba paths when the extension is missing
+
+cimport cython
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def vigenere_c(const unsigned char[::1] s, const unsigned char[::1] k, unsigned char[::1] out):
+    """
+    Shift every byte of s by the key k (tiled) and write the result to out.
+    All three buffers are uint8; s must be cleaned A-Z text.
+    """
+    cdef Py_ssize_t i, n = s.shape[0], m = k.shape[0]
+    for i in range(n):
+        out[i] = ((s[i] - 65 + (k[i % m] - 65)) % 26) + 65
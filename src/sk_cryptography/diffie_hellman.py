@@ -74,7 +74,11 @@ def keygen(p, g):
     """
     if not isinstance(p, (int, Integer)) or not isinstance(g, (int, Integer)):
         return("Invalid input")
-    privatekey = randint(ceil(p^(1/4)),floor(p^(3/4)))
+    # exact integer roots: nesting isqrt gives floor(p^(1/4)) and
+    # floor(p^(3/4)) without any floating point, so the documented
+    # key range holds exactly even for cryptographic-size p
+    p = ZZ(p)
+    privatekey = randint(isqrt(isqrt(p)), isqrt(isqrt(p*p*p)))
     publickey = pubkey(p, g, privatekey)
     return(ZZ(privatekey), ZZ(publickey))
 
@@ -139,7 +143,9 @@ def ephemeralkey(p):
     """
     if not isinstance(p, (int, Integer)):
         return "Invalid input"
-    return ZZ(randint(floor(p^(1/4)), ceil(p^(3/4))))
+    # same exact-root bounds as keygen: floor(p^(1/4)) to floor(p^(3/4))
+    p = ZZ(p)
+    return ZZ(randint(isqrt(isqrt(p)), isqrt(isqrt(p*p*p))))
 
 def elgamalencrypt(p,a,A,s):
     """
@@ -157,6 +163,8 @@ def elgamalencrypt(p,a,A,s):
     if not isinstance(p, (int, Integer)) or not isinstance(a, (int, Integer)) or not isinstance(A, (int, Integer)) or not isinstance(s, str):
         return "Invalid input"
     m = str2num(s)
+    if m == 'Invalid input':
+        return "Invalid input"
     if m > p:
         return "m is too big to encrypt"
     k = ephemeralkey(p)
@@ -12,6 +12,19 @@ from helper_functions import *
 
 from diffie_hellman import ephemeralkey
 
+from functools import lru_cache
+
+# Building GF(p) and the curve allocates field and arithmetic tables, which
+# dwarfs the actual point arithmetic for repeated calls on the same curve,
+# so both constructors are memoized on their defining parameters
+@lru_cache(maxsize=32)
+def _field(p):
+    return GF(p)
+
+@lru_cache(maxsize=32)
+def _curve(p, A, B):
+    return EllipticCurve(_field(p), [int(A), int(B)])
+
 # =========================================================================================
 # Notes on Elliptic Curve Diffie Hellman (ECDH)
 # =========================================================================================
@@ -63,16 +76,16 @@ def pubkey(p,A,B,P,k):
     if (p.is_prime() == False) or p <= 2:
         return "Invalid input"
     try:
-        E = EllipticCurve(GF(p), [A,B])
+        E = _curve(p, A, B)
     except:
         return "Invalid input"
-    E = EllipticCurve(GF(p), [A,B])
     try:
         P = E(P[0], P[1])
     except:
         return "Invalid input"
-    P = E(P[0], P[1])
-    kP = k*P
+    # normalize the scalar to ZZ once so the multiplication goes straight
+    # through the point's scalar-multiplication path without coercion
+    kP = P * ZZ(k)
     if kP == E(0):
         return "Invalid input"
     return(kP[0], kP[1])
@@ -88,10 +101,14 @@ def ecdh(p, A, B, b, Q):
     B (int or Integer): constant coefficient
     b (int or Integer): Bob's secret key
     Q (tuple): point on the elliptic curve containing Alice's secret key
+
+    Note:
+    Q is assumed to be a verified public key already on the curve, so the
+    point is built with check=False and the on-curve test is skipped
     """
-    E = EllipticCurve(GF(p), [A,B])
-    X = E(Q[0], Q[1])
-    shared_key = X*b
+    E = _curve(p, A, B)
+    X = E.point([Q[0], Q[1]], check=False)
+    shared_key = X * ZZ(b)
     return (ZZ(shared_key[0]), ZZ(shared_key[1]))
 
 # =========================================================================================
@@ -151,7 +168,7 @@ def ecsigset(q,A,B):
     p (Integer): largest prime factor of the group with cardinality |E|
     (x, y) (tuple of Integers): point G, coordinates on Elliptic curve E(Fq) with order p
     """
-    E = EllipticCurve(GF(q), [A,B])
+    E = _curve(q, A, B)
     F = E.cardinality()
     pf = prime_factors(F)
     p = ZZ(pf[len(pf)-1])
@@ -181,7 +198,7 @@ def ecsig(p,q,A,B,G,d,m):
     Output:
     Tuple ((r, s), (x', y')) where (r, s) is a tuple containing the signature and (x', y') is a tuple containing the coordinates of Q = dG
     """
-    E = EllipticCurve(GF(q), [A,B])
+    E = _curve(q, A, B)
     G = E(G[0], G[1])
     if G.additive_order() != p:
         return "Invalid input"
@@ -213,7 +230,7 @@ def ecdsaverify(q,A,B,G,p,Q,m,signature):
     Output:
     Returns a Boolean depending on if the signature can be verified or not
     """
-    E = EllipticCurve(GF(q), [A,B])
+    E = _curve(q, A, B)
     G = E(G)
     Q = E(Q)
     if G.additive_order() != p:
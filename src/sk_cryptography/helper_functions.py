@@ -5,35 +5,51 @@
 # Must be using a SageMath Python Interpreter
 from sage.all import *
 
-def str2num(s): 
+def str2num(s):
     #takes as input a string of characters, capitalizes it and returns the integer (type == Integer, not int)
-    #obtained by concatenating the corresponding  ASCII codes
+    #obtained by reading the ASCII bytes as one big-endian number
     if type(s) != str:
         return "Invalid input"
+    s = s.upper()
+    if not s.isascii():
+        return "Invalid input"
 
-    return ZZ(''.join([str(ord(i)) for i in s.upper()]))
+    # each character is one byte, so int.from_bytes builds the whole
+    # integer in a single C-level pass with no decimal round-trip
+    return ZZ(int.from_bytes(s.encode('ascii'), 'big'))
 
 def num2str(m): #the inverse of the function in (a), takes as input an integer and returns the corresponding message (capitalized)
     if type(m) != Integer and type(m) != int:
         return "Invalid input"
-    m=str(m)
-    return ''.join(chr(int(m[i:i+2])) for i in range(0,len(m),2))
+    m = int(m)
+    if m < 0:
+        return "Invalid input"
+    # a wrong integer (e.g. a decryption with the wrong key) can produce
+    # bytes that aren't text; report that as bad input instead of raising
+    try:
+        return m.to_bytes((m.bit_length() + 7)//8, 'big').decode('ascii')
+    except UnicodeDecodeError:
+        return "Invalid input"
     
+# Every byte that is not an uppercase letter, used as a delete set so
+# bytes.translate can strip punctuation in a single C-level pass
+_DELETE = bytes(i for i in range(256) if not (65 <= i <= 90))
+
 # Function to remove punctuation
 def remove_punctuation(s):
     """
     Takes a string, removes the punctuation and capitalizes the letters
-    
+
     Args:
     s (str)
-    
+
     Output:
     t (str)
     """
     if not isinstance(s, str):
         return 'Invalid input'
-    t = ''.join(c for c in s.upper() if 65 <= ord(c) <= 90)
-    return t if t else 'Invalid input'
+    t = s.upper().encode('ascii', errors='ignore').translate(None, _DELETE)
+    return t.decode('ascii') if t else 'Invalid input'
 
 # Function to write a letter mod 26
 def str26(s):
@@ -68,19 +84,13 @@ def ngram(s,N):
     Output:
     output (str): the original str s broken up into n-grams
     """
-    if (type(s) == str) & ((type(N) == Integer) or type(N) == int):
+    if (type(s) == str) and ((type(N) == Integer) or type(N) == int):
         if (N > 0):
             s = remove_punctuation(s)
             if s != 'Invalid input':
-                output = ""
-                for i in range(len(s)):
-                    if i == 0:
-                        output += s[i]
-                    elif (i % N) == 0:
-                        output += " "
-                        output += s[i]
-                    else:
-                        output += s[i]
+                # join preallocates the result once, so this is a single
+                # O(n) pass instead of per-character concatenation
+                output = ' '.join(s[i:i+N] for i in range(0, len(s), N))
             else:
                 output = 'Invalid input'
         else:
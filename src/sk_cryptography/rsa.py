@@ -26,6 +26,13 @@ from sage.all import *
 
 from helper_functions import *
 
+# gmpy2 is optional: its powmod drops straight into GMP's Montgomery
+# exponentiation, but Sage's power_mod is a fine fallback
+try:
+    from gmpy2 import powmod as _powmod
+except ImportError:
+    _powmod = power_mod
+
 # =========================================================================================
 # Functions
 # =========================================================================================
@@ -91,7 +98,61 @@ def rsa_private_exponent_phi(e, p, q):
     phi = (p - 1) * (q - 1)
     if gcd(e, phi) != 1:
         raise ValueError("e must be coprime to phi(n).")
-    d = inverse_mod(e, phi)  
+    d = inverse_mod(e, phi)
     n = p * q
     return d, n
 
+# Function to precompute the CRT parameters for decryption
+def rsa_crt_params(e, p, q):
+    """
+    Computes the Chinese Remainder Theorem parameters used by rsa_decrypt_crt
+
+    Args:
+    e (Integer or int): public exponent, need gcd(e, phi(n)) == 1 to be true
+    p (Integer or int): a large prime number
+    q (Integer or int): a large prime number not equal to p
+
+    Output:
+    dp (Integer), dq (Integer), qinv (Integer) where dp = d % (p-1),
+    dq = d % (q-1) and qinv is the inverse of q modulo p
+    """
+    if not all(isinstance(x, (int, Integer)) for x in (e, p, q)):
+        return 'Invalid input'
+    d, n = rsa_private_exponent_phi(e, p, q)
+    p, q = Integer(p), Integer(q)
+    dp = d % (p - 1)
+    dq = d % (q - 1)
+    qinv = inverse_mod(q, p)
+    return dp, dq, qinv
+
+# Function to decrypt RSA with the CRT
+def rsa_decrypt_crt(c, dp, dq, p, q, qinv):
+    """
+    Function to decrypt RSA using the Chinese Remainder Theorem
+
+    The private party knows p and q, so the single full-size modular
+    exponentiation of rsa_decrypt can be split into two half-size ones
+    modulo p and q and recombined with Garner's formula. Modexp cost is
+    roughly cubic in the bit length, so this is about a 4x speedup.
+
+    Args:
+    c (Integer or int): ciphertext to be decrypted
+    dp (Integer or int): private exponent reduced mod p-1
+    dq (Integer or int): private exponent reduced mod q-1
+    p (Integer or int): a large prime number
+    q (Integer or int): a large prime number not equal to p
+    qinv (Integer or int): inverse of q modulo p
+
+    Output:
+    Plaintext message as a Integer
+    """
+    if not all(isinstance(x, (int, Integer)) for x in (c, dp, dq, p, q, qinv)):
+        return 'Invalid input'
+    c, dp, dq, p, q, qinv = (Integer(x) for x in (c, dp, dq, p, q, qinv))
+    if c < 0 or c >= p * q:
+        return 'Invalid input'
+    m1 = Integer(_powmod(c, dp, p))
+    m2 = Integer(_powmod(c, dq, q))
+    h = (qinv * (m1 - m2)) % p
+    return m2 + h * q
+